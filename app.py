@@ -1,38 +1,60 @@
 import streamlit as st
 import pandas as pd
 import re
+import xlsxwriter
 from io import BytesIO
+from operator import itemgetter
 
-# Function to parse bin ID
+# Bin ID pattern, compiled once at import
+BIN_ID_PATTERN = re.compile(r'P-(\d+)-([A-Z])(\d+)([A-Z])(\d+)')
+
+# Pick sequence column headings, in parse_bin_id field order
+COLUMNS = ['Bin ID', 'Floor', 'Mod', 'Aisle', 'Shelf', 'Bin Number']
+
+# Function to parse bin ID into (bin_id, floor, mod, aisle, shelf, bin_num)
 def parse_bin_id(bin_id):
-    pattern = r'P-(\d+)-([A-Z])(\d+)([A-Z])(\d+)'
-    match = re.match(pattern, bin_id)
+    match = BIN_ID_PATTERN.match(bin_id)
     if match:
         floor, mod, aisle, shelf, bin_num = match.groups()
-        return {
-            'bin_id': bin_id,
-            'floor': int(floor),
-            'mod': mod,
-            'aisle': int(aisle),
-            'shelf': shelf,
-            'bin_num': int(bin_num)
-        }
+        return (bin_id, int(floor), mod, int(aisle), shelf, int(bin_num))
     return None
 
 # Function to sort bins for picking sequence
 def sort_bins(bin_ids):
-    parsed_bins = [parse_bin_id(bin_id) for bin_id in bin_ids if parse_bin_id(bin_id)]
+    # Parse and sort in one pass, dropping invalid IDs
     # Sort by aisle, then shelf (A to Z), then bin number
-    sorted_bins = sorted(parsed_bins, key=lambda x: (x['aisle'], x['shelf'], x['bin_num']))
+    sorted_bins = sorted(filter(None, map(parse_bin_id, bin_ids)), key=itemgetter(3, 4, 5))
     return sorted_bins
 
+# Function to build the pick sequence table, cached on the input text
+@st.cache_data(max_entries=8, show_spinner=False)
+def build_pick_sequence(bin_input):
+    bin_ids = [bid for bid in map(str.strip, bin_input.splitlines()) if bid]
+    sorted_bins = sort_bins(bin_ids)
+    if not sorted_bins:
+        return None
+    # Rows are already in column order, so the table needs no reorder or rename
+    df = pd.DataFrame(sorted_bins, columns=COLUMNS)
+    return df
+
 # Function to convert sorted bins to Excel
 def to_excel(df):
     output = BytesIO()
-    with pd.ExcelWriter(output, engine='xlsxwriter') as writer:
-        df.to_excel(writer, index=False, sheet_name='Pick Sequence')
+    # Write whole rows with xlsxwriter; df.to_excel formats each cell in Python
+    with xlsxwriter.Workbook(output, {'in_memory': True}) as workbook:
+        worksheet = workbook.add_worksheet('Pick Sequence')
+        header_format = workbook.add_format({'bold': True, 'border': 1, 'align': 'center', 'valign': 'top'})
+        worksheet.write_row(0, 0, df.columns, header_format)
+        worksheet.freeze_panes(1, 0)
+        for row_num, row in enumerate(df.itertuples(index=False, name=None), start=1):
+            worksheet.write_row(row_num, 0, row)
     return output.getvalue()
 
+# Function to build the Excel export, cached on the input text
+@st.cache_data(max_entries=8, show_spinner=False)
+def build_pick_sequence_excel(bin_input):
+    return to_excel(build_pick_sequence(bin_input))
+
 # Streamlit app
 st.title("Warehouse Pick Sequence Generator")
 st.write("Enter bin IDs (one per line, e.g., P-1-B200A200) and generate a sorted pick sequence.")
@@ -43,26 +65,21 @@ generate_button = st.button("Generate Pick Sequence")
 
 if generate_button and bin_input:
     # Process input
-    bin_ids = [bid.strip() for bid in bin_input.split('\n') if bid.strip()]
-    if not bin_ids:
+    bin_input = bin_input.strip()
+    if not bin_input:
         st.error("Please enter at least one valid bin ID.")
     else:
         # Parse and sort bins
-        sorted_bins = sort_bins(bin_ids)
-        if not sorted_bins:
+        df = build_pick_sequence(bin_input)
+        if df is None:
             st.error("No valid bin IDs found. Format: P-floor-mod aisle shelf bin (e.g., P-1-B200A200).")
         else:
-            # Create DataFrame
-            df = pd.DataFrame(sorted_bins)
-            df = df[['bin_id', 'floor', 'mod', 'aisle', 'shelf', 'bin_num']]
-            df.columns = ['Bin ID', 'Floor', 'Mod', 'Aisle', 'Shelf', 'Bin Number']
-            
             # Display results
             st.subheader("Sorted Pick Sequence")
             st.dataframe(df)
             
             # Excel download
-            excel_data = to_excel(df)
+            excel_data = build_pick_sequence_excel(bin_input)
             st.download_button(
                 label="Download Pick Sequence as Excel",
                 data=excel_data,